@@ -1,9 +1,10 @@
 from flask import Flask, render_template, request, jsonify, redirect, url_for, flash, session
-from models import db, Course, Chapter, Lesson, Schedule, TodaysTask, Quiz
+from models import db, Course, Chapter, Lesson, LessonChunk, Schedule, TodaysTask, Quiz
 from utils import (
     chapter_chain, lesson_chain, generate_schedule, content_chain, 
-    quiz_chain, create_rag_vector_store, rag_answer
+    quiz_chain, chunk_markdown, create_rag_vector_store, rag_answer
 )
+from sqlalchemy.exc import IntegrityError
 from datetime import datetime, timedelta
 import json
 import os
@@ -170,6 +171,22 @@ def save_course_to_db(course_name, chapters, lessons, schedule):
     
     db.session.commit()
 
+def save_lesson_chunks(lesson):
+    LessonChunk.query.filter_by(lesson_id=lesson.lesson_id).delete()
+    
+    for i, chunk in enumerate(chunk_markdown(lesson.content or ""), 1):
+        lesson_chunk = LessonChunk(
+            lesson_id=lesson.lesson_id,
+            chunk_order=i,
+            start_offset=chunk['start_offset'],
+            end_offset=chunk['end_offset'],
+            text=chunk['text']
+        )
+        lesson_chunk.set_heading_path(chunk['heading_path'])
+        db.session.add(lesson_chunk)
+    
+    db.session.commit()
+
 @app.route('/course/<course_name>')
 def course_detail(course_name):
     course = Course.query.filter_by(course_name=course_name).first()
@@ -223,10 +240,18 @@ def lesson_view(course_name, chapter_id, lesson_id):
             db.session.commit()
         except Exception as e:
             flash(f'Error generating lesson content: {str(e)}', 'error')
+        
+        if lesson.content:
+            try:
+                save_lesson_chunks(lesson)
+            except Exception as e:
+                db.session.rollback()
+                print(f"Chunking error: {str(e)}")
     
     return render_template('lesson_view.html',
                          course_name=course_name,
                          chapter_title=chapter.chapter_title,
+                         lesson_id=lesson.lesson_id,
                          lesson_title=lesson.lesson_title,
                          content=lesson.content)
 
@@ -334,8 +359,13 @@ def ask_question():
         course_name = data.get('course_name')
         chapter_title = data.get('chapter_title')
         lesson_title = data.get('lesson_title')
+        lesson_id = data.get('lesson_id')
         content = data.get('content')
         
+        lesson = Lesson.query.get(lesson_id) if lesson_id else None
+        if lesson and lesson.content:
+            content = lesson.content
+        
         if not all([question, course_name, chapter_title, lesson_title]):
             return jsonify({'success': False, 'error': 'Missing required fields'})
         
@@ -345,7 +375,23 @@ def ask_question():
                 'error': 'No lesson content available to answer questions'
             })
         
-        vector_store, chunks = create_rag_vector_store(content)
+        if lesson and lesson.content:
+            if not lesson.chunks:
+                try:
+                    save_lesson_chunks(lesson)
+                except IntegrityError:
+                    db.session.rollback()
+            chunks = [chunk.to_dict() for chunk in lesson.chunks]
+        else:
+            chunks = list(chunk_markdown(content))
+        
+        if not chunks:
+            return jsonify({
+                'success': False, 
+                'error': 'No lesson content available to answer questions'
+            })
+        
+        vector_store, chunks = create_rag_vector_store(chunks)
         answer, citation = rag_answer(question, vector_store, chunks, course_name, chapter_title, lesson_title)
         
         return jsonify({
@@ -0,0 +1,286 @@
+"""Compare the markdown-aware chunker against the old fixed-size splitter.
+
+Reports chunks per lesson, longest chunk and recall@k on two sample
+lessons, and chunk counts for any lessons already stored in courses.db.
+
+Usage: python benchmark_chunking.py [--k 3]
+"""
+import argparse
+import time
+from langchain_community.vectorstores import FAISS
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+from utils import SentenceTransformerEmbeddings, chunk_markdown
+
+SAMPLE_LESSON = """# Python Loops
+
+Loops let a program repeat a block of code without writing it out many times. Python has two loop statements, `for` and `while`, and both can be controlled with `break` and `continue`.
+
+## For Loops
+
+A `for` loop iterates over the items of any iterable, such as a list, a string, or a dictionary. On each pass the loop variable is bound to the next item, and the loop ends when the iterable is exhausted.
+
+The built-in `range()` function produces a sequence of integers and is the usual way to repeat something a fixed number of times. `range(5)` yields 0 through 4, and `range(2, 10, 2)` yields the even numbers from 2 to 8.
+
+```python
+fruits = ["apple", "banana", "cherry"]
+for fruit in fruits:
+    print(fruit)
+
+for i in range(2, 10, 2):
+    print(i)
+```
+
+### Iterating With enumerate
+
+When you need both the index and the value, wrap the iterable in `enumerate()`. It returns pairs of (index, item), which avoids keeping a manual counter.
+
+```python
+for index, fruit in enumerate(fruits):
+    print(index, fruit)
+```
+
+## While Loops
+
+A `while` loop keeps running as long as its condition is true. It is useful when the number of iterations is not known in advance, such as reading input until the user types "quit".
+
+If the condition never becomes false the loop runs forever. This is called an infinite loop, and it is a common beginner bug when the loop variable is never updated.
+
+```python
+count = 0
+while count < 3:
+    print(count)
+    count += 1
+```
+
+## Controlling Loops
+
+The `break` statement exits the nearest enclosing loop immediately. The `continue` statement skips the rest of the current iteration and moves on to the next one.
+
+Loops may also have an `else` clause, which runs only if the loop finished without hitting `break`. This is handy for search loops that need a "not found" branch.
+
+```python
+for n in range(2, 10):
+    for x in range(2, n):
+        if n % x == 0:
+            break
+    else:
+        print(n, "is a prime number")
+```
+
+## Practical Applications
+
+Loops are used to process every row of a file, to retry a network request a limited number of times, and to build up results such as totals or filtered lists. List comprehensions are a compact alternative for building lists from a loop.
+"""
+
+SAMPLE_LESSON_QUESTIONS = [
+    ("How do I repeat something a fixed number of times?", "range(5)"),
+    ("How can I get the index while looping over a list?", "enumerate()"),
+    ("What is an infinite loop?", "infinite loop"),
+    ("What does continue do?", "skips the rest of the current iteration"),
+    ("When does the else block of a loop run?", "without hitting `break`"),
+    ("Show an example of a while loop", "while count < 3"),
+    ("What are loops used for in practice?", "retry a network request"),
+    ("How do I find prime numbers with a loop?", "is a prime number"),
+]
+
+# Shaped like content_chain output: no "#" title, only "##" sections, with a
+# long unpunctuated list and a long code block.
+BUILTINS_LESSON = """## Overview of Built-in Functions
+
+Python ships with a set of functions that are always available without an import. Knowing them saves you from rewriting common helpers.
+
+## Reference List
+
+- `abs(x)` returns the absolute value of a number
+- `all(iterable)` is true when every element is truthy
+- `any(iterable)` is true when at least one element is truthy
+- `ascii(obj)` gives a printable representation with non-ASCII characters escaped
+- `bin(x)` converts an integer to a binary string prefixed with 0b
+- `bool(x)` converts a value to True or False
+- `bytearray(source)` builds a mutable sequence of bytes
+- `bytes(source)` builds an immutable sequence of bytes
+- `callable(obj)` checks whether an object can be called like a function
+- `chr(i)` returns the character for a Unicode code point
+- `dict(**kwargs)` creates a new dictionary
+- `dir(obj)` lists the attribute names of an object
+- `divmod(a, b)` returns the quotient and remainder together as a pair
+- `enumerate(iterable)` yields index and value pairs
+- `eval(expression)` evaluates a string as a Python expression
+- `filter(function, iterable)` keeps the items for which the function returns true
+- `float(x)` converts a number or string to a floating point value
+- `format(value, spec)` formats a value using a format specification
+- `frozenset(iterable)` builds an immutable set
+- `getattr(obj, name)` reads an attribute by its name as a string
+- `hasattr(obj, name)` checks whether an attribute exists
+- `hash(obj)` returns the hash value used by dictionaries and sets
+- `help(obj)` opens the interactive help system
+- `hex(x)` converts an integer to a hexadecimal string prefixed with 0x
+- `id(obj)` returns the identity of an object
+- `input(prompt)` reads a line of text typed by the user
+- `int(x)` converts a number or string to an integer
+- `isinstance(obj, cls)` checks whether an object is an instance of a class
+- `iter(obj)` returns an iterator for an iterable
+- `len(s)` returns the number of items in a container
+- `list(iterable)` builds a new list
+- `map(function, iterable)` applies a function to every item
+- `max(iterable)` returns the largest item
+- `min(iterable)` returns the smallest item
+- `next(iterator)` fetches the following item from an iterator
+- `oct(x)` converts an integer to an octal string prefixed with 0o
+- `open(file)` opens a file and returns a file object
+- `ord(c)` returns the Unicode code point of a single character
+- `pow(base, exp)` raises a number to a power with an optional modulus
+- `print(*objects)` writes text to standard output
+- `range(stop)` produces an arithmetic sequence of integers
+- `repr(obj)` returns a developer friendly representation
+- `reversed(seq)` iterates over a sequence backwards
+- `round(number, ndigits)` rounds a number to a given precision
+- `set(iterable)` builds a new set with duplicates removed
+- `sorted(iterable)` returns a new sorted list without changing the original
+- `str(obj)` converts a value to its string form
+- `sum(iterable)` adds up all the numbers in an iterable
+- `tuple(iterable)` builds an immutable sequence
+- `type(obj)` returns the class of an object
+- `zip(*iterables)` pairs up items from several iterables position by position
+
+## Putting Them Together
+
+The script below combines many of these functions to summarise a list of exam scores.
+
+```python
+scores = {
+    "alice": [88, 92, 79],
+    "bob": [65, 70, 58],
+    "carol": [95, 98, 100],
+    "dave": [72, 68, 81],
+}
+
+
+def average(values):
+    return sum(values) / len(values)
+
+
+def letter_grade(avg):
+    if avg >= 90:
+        return "A"
+    if avg >= 80:
+        return "B"
+    if avg >= 70:
+        return "C"
+    if avg >= 60:
+        return "D"
+    return "F"
+
+
+def summarise(scores):
+    report = []
+    for name, values in sorted(scores.items()):
+        avg = average(values)
+        report.append((name, round(avg, 1), letter_grade(avg)))
+    return report
+
+
+def best_student(scores):
+    return max(scores, key=lambda name: average(scores[name]))
+
+
+def failing_students(scores):
+    return list(filter(lambda name: average(scores[name]) < 60, scores))
+
+
+def pair_names_with_grades(scores):
+    names = sorted(scores)
+    grades = map(lambda name: letter_grade(average(scores[name])), names)
+    return dict(zip(names, grades))
+
+
+if __name__ == "__main__":
+    for name, avg, grade in summarise(scores):
+        print(f"{name:<8} {avg:>6} {grade}")
+    print("Top of the class:", best_student(scores))
+    print("Needs help:", failing_students(scores) or "nobody")
+    print("Grade book:", pair_names_with_grades(scores))
+```
+
+## Common Mistakes
+
+Shadowing a built-in by naming a variable `list` or `sum` hides the original function for the rest of the module. Pick descriptive names such as `items` or `total` instead.
+"""
+
+BUILTINS_QUESTIONS = [
+    ("How do I get the quotient and remainder at once?", "divmod(a, b)"),
+    ("How do I sort without changing the original list?", "returns a new sorted list"),
+    ("How do I pair up items from two lists?", "pairs up items from several iterables"),
+    ("How do I turn a number into hexadecimal?", "hexadecimal string prefixed with 0x"),
+    ("How does the script find the best student?", "def best_student(scores)"),
+    ("How are names paired with grades in the example?", "dict(zip(names, grades))"),
+    ("How is the letter grade chosen?", "def letter_grade(avg)"),
+    ("Why should I not name a variable list?", "Shadowing a built-in"),
+]
+
+SAMPLES = [
+    ("loops (# title)", SAMPLE_LESSON, SAMPLE_LESSON_QUESTIONS),
+    ("built-ins (## only, long list + code)", BUILTINS_LESSON, BUILTINS_QUESTIONS),
+]
+
+def baseline_chunks(content):
+    text_splitter = RecursiveCharacterTextSplitter(
+        chunk_size=500,
+        chunk_overlap=50,
+        separators=["\n## ", "\n\n", "\n", ". "]
+    )
+    return text_splitter.split_text(content)
+
+def markdown_chunks(content):
+    texts = []
+    for chunk in chunk_markdown(content):
+        heading = " > ".join(chunk["heading_path"])
+        texts.append(f"{heading}\n{chunk['text']}" if heading else chunk["text"])
+    return texts
+
+def recall_at_k(texts, questions, embedder, k):
+    vector_store = FAISS.from_texts(texts, embedder)
+    hits = 0
+    for question, expected in questions:
+        docs = vector_store.similarity_search(question, k=k)
+        if any(expected in doc.page_content for doc in docs):
+            hits += 1
+    return hits / len(questions)
+
+def stored_lesson_contents():
+    try:
+        from app import app
+        from models import Lesson
+        with app.app_context():
+            return [lesson.content for lesson in Lesson.query.filter(Lesson.content.isnot(None)).all()]
+    except Exception as e:
+        print(f"Skipping stored lessons: {str(e)}")
+        return []
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--k", type=int, default=3, help="number of chunks retrieved per question")
+    args = parser.parse_args()
+
+    embedder = SentenceTransformerEmbeddings('all-MiniLM-L6-v2')
+
+    for sample_name, content, questions in SAMPLES:
+        print(f"Sample lesson: {sample_name} ({len(questions)} questions, k={args.k})")
+        for name, splitter in [("fixed-size", baseline_chunks), ("markdown", markdown_chunks)]:
+            start = time.perf_counter()
+            texts = splitter(content)
+            elapsed = (time.perf_counter() - start) * 1000
+            recall = recall_at_k(texts, questions, embedder, args.k)
+            longest = max(len(text) for text in texts)
+            print(f"  {name:<10} chunks={len(texts):<4} longest={longest:<5} recall@{args.k}={recall:.2f} split_ms={elapsed:.2f}")
+
+    contents = stored_lesson_contents()
+    if contents:
+        baseline_total = sum(len(baseline_chunks(content)) for content in contents)
+        markdown_total = sum(len(markdown_chunks(content)) for content in contents)
+        print(f"Stored lessons ({len(contents)})")
+        print(f"  fixed-size chunks/lesson={baseline_total / len(contents):.1f}")
+        print(f"  markdown   chunks/lesson={markdown_total / len(contents):.1f}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+import re
+from typing import Dict
+
+HEADING_RE = re.compile(r'^(#{1,6})\s+(.*?)(?:\s+#+)?\s*$')
+FENCE_RE = re.compile(r'^\s*(```|~~~)')
+SENTENCE_RE = re.compile(r'[.!?]\s+')
+WHITESPACE_RE = re.compile(r'\s+')
+
+# all-MiniLM-L6-v2 truncates input at 256 tokens; 800 chars plus the
+# heading prefix stays inside that window for typical lesson prose.
+MAX_CHUNK_CHARS = 800
+
+def iter_markdown_blocks(content: str):
+    """Yield (heading_path, start, end, is_code) for each paragraph or fenced code block."""
+    headings = []
+    fence = None
+    block_start = None
+    offset = 0
+
+    for line in content.splitlines(keepends=True):
+        line_start = offset
+        offset += len(line)
+
+        if fence:
+            if line.strip().startswith(fence):
+                yield _heading_path(headings), block_start, offset, True
+                fence = None
+                block_start = None
+            continue
+
+        fence_match = FENCE_RE.match(line)
+        heading_match = HEADING_RE.match(line)
+        if fence_match or heading_match or not line.strip():
+            if block_start is not None:
+                yield _heading_path(headings), block_start, line_start, False
+                block_start = None
+
+        if fence_match:
+            fence = fence_match.group(1)
+            block_start = line_start
+        elif heading_match:
+            level = len(heading_match.group(1))
+            while headings and headings[-1][0] >= level:
+                headings.pop()
+            headings.append((level, heading_match.group(2)))
+        elif line.strip() and block_start is None:
+            block_start = line_start
+
+    if block_start is not None:
+        yield _heading_path(headings), block_start, offset, fence is not None
+
+def _heading_path(headings):
+    return tuple(title for level, title in headings)
+
+def _find_break(content: str, start: int, limit: int, is_code: bool) -> int:
+    """Return the position to end a piece at, preferring structural boundaries."""
+    window = content[start:limit]
+    breaks = [window.rfind('\n')]
+    if not is_code:
+        breaks.extend(m.end() for m in SENTENCE_RE.finditer(window))
+    best = max(breaks)
+    if best > 0:
+        return start + best
+    if not is_code:
+        spaces = [m.start() for m in WHITESPACE_RE.finditer(window)]
+        if spaces and spaces[-1] > 0:
+            return start + spaces[-1]
+    return limit
+
+def _split_long_block(content: str, start: int, end: int, max_chars: int, is_code: bool):
+    piece_start = start
+    while end - piece_start > max_chars:
+        piece_end = _find_break(content, piece_start, piece_start + max_chars, is_code)
+        yield piece_start, piece_end
+        piece_start = piece_end
+        while piece_start < end and content[piece_start].isspace():
+            piece_start += 1
+    yield piece_start, end
+
+def chunk_markdown(content: str, max_chars: int = MAX_CHUNK_CHARS):
+    """Stream chunks that never cross a heading and keep code blocks whole when they fit.
+
+    Consecutive blocks under the same heading path are packed up to max_chars.
+    Longer blocks are split at sentence or line breaks, then at max_chars;
+    content[start_offset:end_offset] is always the chunk text.
+    """
+    current = None
+    for path, start, end, is_code in iter_markdown_blocks(content):
+        end = start + len(content[start:end].rstrip())
+        if current and current[0] == path and end - current[1] <= max_chars:
+            current[2] = end
+            continue
+        if current:
+            yield _make_chunk(content, *current)
+            current = None
+
+        if end - start > max_chars:
+            pieces = list(_split_long_block(content, start, end, max_chars, is_code))
+            for piece_start, piece_end in pieces[:-1]:
+                yield _make_chunk(content, path, piece_start, piece_end)
+            start = pieces[-1][0]
+        current = [path, start, end]
+
+    if current:
+        yield _make_chunk(content, *current)
+
+def _make_chunk(content: str, path, start: int, end: int) -> Dict:
+    end = start + len(content[start:end].rstrip())
+    return {
+        "text": content[start:end],
+        "heading_path": list(path),
+        "start_offset": start,
+        "end_offset": end
+    }
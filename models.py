@@ -32,6 +32,32 @@ class Lesson(db.Model):
     
     schedule_entries = db.relationship('Schedule', backref='lesson', cascade='all, delete-orphan')
     quizzes = db.relationship('Quiz', backref='lesson', cascade='all, delete-orphan')
+    chunks = db.relationship('LessonChunk', backref='lesson', cascade='all, delete-orphan', order_by='LessonChunk.chunk_order')
+
+class LessonChunk(db.Model):
+    __tablename__ = 'lesson_chunks'
+    __table_args__ = (db.UniqueConstraint('lesson_id', 'chunk_order'),)
+    chunk_id = db.Column(db.Integer, primary_key=True)
+    lesson_id = db.Column(db.Integer, db.ForeignKey('lessons.lesson_id'), nullable=False)
+    chunk_order = db.Column(db.Integer, nullable=False)
+    heading_path = db.Column(db.Text, nullable=False)
+    start_offset = db.Column(db.Integer, nullable=False)
+    end_offset = db.Column(db.Integer, nullable=False)
+    text = db.Column(db.Text, nullable=False)
+    
+    def get_heading_path(self):
+        return json.loads(self.heading_path)
+    
+    def set_heading_path(self, heading_list):
+        self.heading_path = json.dumps(heading_list)
+    
+    def to_dict(self):
+        return {
+            'text': self.text,
+            'heading_path': self.get_heading_path(),
+            'start_offset': self.start_offset,
+            'end_offset': self.end_offset
+        }
 
 class Schedule(db.Model):
     __tablename__ = 'schedule'
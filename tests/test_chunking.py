@@ -0,0 +1,60 @@
+from chunking import chunk_markdown, iter_markdown_blocks
+
+
+def paths(content, **kwargs):
+    return [chunk["heading_path"] for chunk in chunk_markdown(content, **kwargs)]
+
+
+def test_offsets_match_text():
+    content = "# Title\n\nIntro.\n\n## A\nFirst.\n\n```python\nx = 1\n```\n\n## B\nSecond.\n"
+    chunks = list(chunk_markdown(content))
+    assert chunks
+    for chunk in chunks:
+        assert content[chunk["start_offset"]:chunk["end_offset"]] == chunk["text"]
+
+
+def test_sibling_sections_without_title():
+    assert paths("## A\nx\n\n## B\ny\n\n## C\nz") == [["A"], ["B"], ["C"]]
+
+
+def test_skipped_and_returning_levels():
+    content = "# T\na\n\n### Deep\nb\n\n## Mid\nc\n\n# U\nd"
+    assert paths(content) == [["T"], ["T", "Deep"], ["T", "Mid"], ["U"]]
+
+
+def test_heading_keeps_trailing_hash_in_text():
+    assert paths("## Intro to C#\nx\n\n## F#\ny") == [["Intro to C#"], ["F#"]]
+    assert paths("## Closed ##\nx") == [["Closed"]]
+
+
+def test_fence_kept_whole():
+    code = "```python\ndef f():\n\n    # not a heading\n    return 1\n```"
+    content = f"## Code\nBefore.\n\n{code}\n\nAfter."
+    blocks = list(iter_markdown_blocks(content))
+    assert [(content[start:end].strip(), is_code) for _, start, end, is_code in blocks][1] == (code, True)
+    assert all(path == ("Code",) for path, _, _, _ in blocks)
+    assert any(code in chunk["text"] for chunk in chunk_markdown(content))
+
+
+def test_long_list_respects_limit():
+    content = "## Items\n" + "\n".join(f"- item number {i} with a few words" for i in range(60))
+    chunks = list(chunk_markdown(content, max_chars=300))
+    assert len(chunks) > 1
+    for chunk in chunks:
+        assert len(chunk["text"]) <= 300
+        assert chunk["text"].startswith("- item")
+
+
+def test_unpunctuated_text_and_long_code_respect_limit():
+    words = " ".join("word" for _ in range(2000))
+    code = "```\n" + "\n".join(f"value_{i} = {i}" for i in range(200)) + "\n```"
+    for content in (words, code):
+        chunks = list(chunk_markdown(content, max_chars=300))
+        assert len(chunks) > 1
+        for chunk in chunks:
+            assert len(chunk["text"]) <= 300
+            assert content[chunk["start_offset"]:chunk["end_offset"]] == chunk["text"]
+
+
+def test_headings_only_gives_no_chunks():
+    assert list(chunk_markdown("# Title\n\n## Empty\n   \n")) == []
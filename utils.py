@@ -7,10 +7,11 @@ from pydantic import BaseModel, Field
 from dotenv import load_dotenv
 from datetime import datetime, timedelta
 import json
+from html import escape
 from sentence_transformers import SentenceTransformer
 from langchain_community.vectorstores import FAISS
-from langchain_text_splitters import RecursiveCharacterTextSplitter
 from langchain_core.embeddings import Embeddings
+from chunking import chunk_markdown
 
 load_dotenv()
 
@@ -99,15 +100,13 @@ quiz_prompt = ChatPromptTemplate.from_template(
 )
 quiz_chain = quiz_prompt | llm | PydanticOutputParser(pydantic_object=QuizSchema)
 
-def create_rag_vector_store(content: str):
-    text_splitter = RecursiveCharacterTextSplitter(
-        chunk_size=500,
-        chunk_overlap=50,
-        separators=["\n## ", "\n\n", "\n", ". "]
-    )
-    chunks = text_splitter.split_text(content)
+def create_rag_vector_store(chunks: List[Dict]):
+    texts = []
+    for chunk in chunks:
+        heading = " > ".join(chunk["heading_path"])
+        texts.append(f"{heading}\n{chunk['text']}" if heading else chunk["text"])
     embedder = SentenceTransformerEmbeddings('all-MiniLM-L6-v2')
-    vector_store = FAISS.from_texts(chunks, embedder)
+    vector_store = FAISS.from_texts(texts, embedder, metadatas=chunks)
     return vector_store, chunks
 
 rag_prompt = ChatPromptTemplate.from_template(
@@ -142,8 +141,12 @@ def rag_answer(question: str, vector_store, chunks, course_name: str, chapter_ti
         docs = vector_store.similarity_search(question, k=3)
         
         context_parts = []
+        sections = []
         for i, doc in enumerate(docs):
             context_parts.append(f"{doc.page_content}")
+            section = " &rsaquo; ".join(escape(h) for h in doc.metadata.get("heading_path", []))
+            if section and section not in sections:
+                sections.append(section)
         
         context = "\n\n".join(context_parts)
         
@@ -158,7 +161,8 @@ def rag_answer(question: str, vector_store, chunks, course_name: str, chapter_ti
         
         answer = result.content
         
-        citation = f'\n\n<small class="text-muted"><i class="fas fa-book me-1"></i>Reference: {lesson_title}</small>'
+        reference = f'{lesson_title} &rsaquo; {"; ".join(sections)}' if sections else lesson_title
+        citation = f'\n\n<small class="text-muted"><i class="fas fa-book me-1"></i>Reference: {reference}</small>'
         
         return answer + citation, "Formatted explanation"
         